@@ -1,16 +1,51 @@
 import tkinter as tk
 import sm_4rel4in
 import time
+import threading
+import math
 
 # -------------------------
 # Hardware setup (leave as-is unless your board address changes)
 # -------------------------
-rel = sm_4rel4in.SM4rel4in(0)  # Initialize 4rel4in HAT
+HAT_STACK_LEVEL = 0   # 4rel4in HAT stack level (set by the board jumpers)
 CHANNEL_OHB_ADD = 1   # Overhead buffer add sensor
 CHANNEL_OHB_SUB = 2   # Overhead buffer subtract sensor
 CHANNEL_WS_ADD = 3    # Wet section add sensor
 CHANNEL_WS_SUB = 4    # Wet section subtract sensor
 
+# Bit masks into the input register (bit 0 = channel 1)
+MASK_OHB_ADD = 1 << (CHANNEL_OHB_ADD - 1)
+MASK_OHB_SUB = 1 << (CHANNEL_OHB_SUB - 1)
+MASK_WS_ADD = 1 << (CHANNEL_WS_ADD - 1)
+MASK_WS_SUB = 1 << (CHANNEL_WS_SUB - 1)
+
+# Per-sensor tables, all indexed the same way (0 = OHB add, 1 = OHB sub, 2 = WS add, 3 = WS sub)
+SENSOR_MASKS = [MASK_OHB_ADD, MASK_OHB_SUB, MASK_WS_ADD, MASK_WS_SUB]
+SENSOR_SIGNS = [+1, -1, +1, -1]   # Count up or down on an accepted rising edge
+SENSOR_TARGETS = [0, 0, 1, 1]     # Which sum the sensor drives (0 = OHB, 1 = WS)
+SENSOR_INDEX = {mask: i for i, mask in enumerate(SENSOR_MASKS)}  # Mask bit -> sensor index
+
+def read_inputs_per_channel():
+    """
+    Fallback for sm_4rel4in versions without get_all_in(): builds the same bit mask from get_in().
+    """
+    bits = 0
+    for channel in (CHANNEL_OHB_ADD, CHANNEL_OHB_SUB, CHANNEL_WS_ADD, CHANNEL_WS_SUB):
+        if rel.get_in(channel) == 1:
+            bits |= 1 << (channel - 1)
+    return bits
+
+def connect_hat():
+    """
+    Opens (or re-opens) the 4rel4in HAT and picks the fastest way to read its inputs.
+    """
+    global rel, read_input_bits
+    rel = sm_4rel4in.SM4rel4in(HAT_STACK_LEVEL)
+    # Read all four inputs with a single I2C transaction when the library supports it
+    read_input_bits = getattr(rel, "get_all_in", None) or read_inputs_per_channel
+
+connect_hat()  # Initialize 4rel4in HAT
+
 # -------------------------
 # CONFIGURATION
 # -------------------------
@@ -30,8 +65,18 @@ WS_THRESHOLDS = [
 OHB_PROGRESS_MAX = 10  # Maximum value displayed on OHB progress bar
 WS_PROGRESS_MAX = 10   # Maximum value displayed on WS progress bar
 
-SENSOR_DELAY = 1000    # Delay in ms after sensor turns off before counting again (1000 = 1s) # Have seen issues with delay affecting all sensors
 POLL_INTERVAL_MS = 10  # How often to poll sensors (ms)
+UI_REFRESH_MS = 33     # How often the UI picks up new counts from the sensor thread (ms)
+
+READ_RETRY_MAX_MS = 2000     # Failed reads back off exponentially from POLL_INTERVAL_MS up to this (ms)
+READ_FAILS_BEFORE_RESET = 5  # Consecutive failed reads before showing a fault and re-opening the HAT
+
+# Debounce integrator, per sensor: +1 per poll while HIGH, -1 while LOW, clamped to 0..DEBOUNCE_SAMPLES.
+# A sensor latches ON when it climbs to DEBOUNCE_ON and OFF when it falls to DEBOUNCE_OFF
+# (4 samples at 10 ms polling = 40 ms window; an ON edge is seen after 30 ms of HIGH).
+DEBOUNCE_SAMPLES = 4
+DEBOUNCE_ON = 3
+DEBOUNCE_OFF = 1
 
 # -------------------------
 # Internal state (can set values here too)
@@ -45,19 +90,37 @@ sum_ws = 0
 prev_total = -1
 prev_ohb = -1
 prev_ws = -1
+prev_fault = False
+
+class SensorState:
+    """
+    Latest sums and HAT fault flag, written by the sensor thread and read by the Tk
+    thread under lock. dirty is set on every write and cleared when the Tk thread
+    picks the values up.
+    """
+    __slots__ = ("sum_ohb", "sum_ws", "fault", "dirty", "lock")
 
-# Sensor detection flags (true when sensor currently considered "held/high")
-sig_ohb_add_detected = False
-sig_ohb_sub_detected = False
-sig_ws_add_detected = False
-sig_ws_sub_detected = False
+    def __init__(self, sum_ohb=0, sum_ws=0):
+        self.sum_ohb = sum_ohb
+        self.sum_ws = sum_ws
+        self.fault = False
+        self.dirty = False
+        self.lock = threading.Lock()
 
-# Sensor delay timers (store timestamp in ms when sensor went LOW)
-# A new rising edge is only accepted if now - timer_X >= SENSOR_DELAY
-timer_ohb_add = 0
-timer_ohb_sub = 0
-timer_ws_add = 0
-timer_ws_sub = 0
+# Sensor thread -> UI handoff
+sensor_state = SensorState(sum_ohb, sum_ws)
+sensor_stop = threading.Event()
+
+# Last raw input register value, and a bit mask of sensors whose integrator is not yet
+# saturated at their raw level; while both are unchanged a poll has nothing to do
+prev_bits = 0
+settling_bits = 0
+
+# Debounce integrators, one per sensor (0..DEBOUNCE_SAMPLES)
+sig_integ = [0] * 4
+
+# Sensor detection flags, one bit per sensor (SENSOR_MASKS), set while latched "held/high"
+held_bits = 0
 
 # -------------------------
 # UI Helper functions
@@ -79,25 +142,32 @@ def pick_color_from_thresholds(value, thresholds, default="#000000"):
             return col
     return default
 
+# (cos, sin) of 0..90 degrees in 8 steps, used to trace each rounded corner
+CORNER_STEPS = [(math.cos(math.pi / 2 * i / 8), math.sin(math.pi / 2 * i / 8)) for i in range(9)]
+
+def rounded_rect_points(x1, y1, x2, y2, r=20):
+    """
+    Returns the flat (x, y, x, y, ...) outline of a rounded rectangle with corner radius r/2,
+    clockwise from the left edge. Corners shrink to fit rectangles narrower or shorter than r.
+    """
+    c = min(r, x2 - x1, y2 - y1) / 2  # corner radius
+    points = []
+    for cs, sn in CORNER_STEPS:  # Top-left
+        points += (x1 + c - c * cs, y1 + c - c * sn)
+    for cs, sn in CORNER_STEPS:  # Top-right
+        points += (x2 - c + c * sn, y1 + c - c * cs)
+    for cs, sn in CORNER_STEPS:  # Bottom-right
+        points += (x2 - c + c * cs, y2 - c + c * sn)
+    for cs, sn in CORNER_STEPS:  # Bottom-left
+        points += (x1 + c - c * sn, y2 - c + c * cs)
+    return points
+
 def rounded_rect(canvas, x1, y1, x2, y2, r=20, **kwargs):
     """
-    Draws a rounded rectangle on a canvas.
+    Draws a rounded rectangle (corner radius r/2) on a canvas as a single
+    unsmoothed polygon. Returns the item id.
     """
-    points = [
-        x1 + r, y1,
-        x2 - r, y1,
-        x2, y1,
-        x2, y1 + r,
-        x2, y2 - r,
-        x2, y2,
-        x2 - r, y2,
-        x1 + r, y2,
-        x1, y2,
-        x1, y2 - r,
-        x1, y1 + r,
-        x1, y1
-    ]
-    return canvas.create_polygon(points, smooth=True, **kwargs)
+    return canvas.create_polygon(rounded_rect_points(x1, y1, x2, y2, r), **kwargs)
 
 # -------------------------
 # Card Classes
@@ -107,25 +177,30 @@ class Card:
     A basic card that shows a title and a numeric value.
     """
     def __init__(self, parent, width, height, title="", title_font=(FONT_FAMILY, 18, "bold"),
-                 value_font=(FONT_FAMILY, 48, "bold"), thresholds=None):
+                 value_font=(FONT_FAMILY, 48, "bold"), create_texts=True):
         self.width = width
         self.height = height
-        self.thresholds = thresholds
         self.canvas = tk.Canvas(parent, width=width+8, height=height+8, bg=WINDOW_BG, highlightthickness=0)
         # Shadow
         rounded_rect(self.canvas, 4, 4, width+4, height+4, r=18, fill=SHADOW_COLOR, outline="")
         # Background gradient
         rounded_rect(self.canvas, 0, 0, width, height, r=18, fill=CARD_BG, outline="")
-        # Title text
-        self.title_id = self.canvas.create_text(width/2, height*0.3, text=title, font=title_font, fill=TITLE_COLOR)
-        # Numeric value
-        self.value_id = self.canvas.create_text(width/2, height*0.65, text="0", font=value_font, fill="black")
+        # Subclasses with their own layout pass create_texts=False and draw their own
+        if create_texts:
+            # Title text
+            self.title_id = self.canvas.create_text(width/2, height*0.3, text=title, font=title_font, fill=TITLE_COLOR)
+            # Numeric value
+            self.value_id = self.canvas.create_text(width/2, height*0.65, text="0", font=value_font, fill="black")
+        else:
+            self.title_id = self.value_id = None
         self.current_value = 0
 
     def set_value(self, new_value):
         """
         Updates the numeric value displayed. Color does not change for flashing.
         """
+        if new_value == self.current_value:
+            return
         self.canvas.itemconfigure(self.value_id, text=str(new_value))
         self.current_value = new_value
 
@@ -143,12 +218,10 @@ class ProgressCard(Card):
                  title_font=(FONT_FAMILY, 14, "bold"), value_font=(FONT_FAMILY, 20, "bold"),
                  progress_max=10, thresholds=None):
         super().__init__(parent, width, height, title=title, title_font=title_font,
-                         value_font=value_font, thresholds=None)
+                         value_font=value_font, create_texts=False)
         self.progress_max = max(1, progress_max)
         self.thresholds = thresholds or []
-        # Remove parent texts
-        self.canvas.delete(self.title_id)
-        self.canvas.delete(self.value_id)
+        self._build_color_table()
         # Left-aligned title
         self.left_title = self.canvas.create_text(width*0.12, height*0.26, anchor="w",
                                                   text=title, font=title_font, fill="#333333")
@@ -160,9 +233,27 @@ class ProgressCard(Card):
         self.track_x2 = width*0.88
         self.track_y = height*0.72
         self.track_r = bar_height//2
-        self.fill_id = None
+        # Fill geometry inside the track; only the right edge depends on the value
+        self._bar_x0 = self.track_x1 + 2
+        self._bar_width = self.track_x2 - self.track_x1 - 4
+        self._bar_y1 = self.track_y - (self.track_r - 2)
+        self._bar_y2 = self.track_y + (self.track_r - 2)
+        self._min_visible_width = 1
         # Draw progress track background
         self._draw_track()
+        # Progress fill: a rounded rect with the same corners as the track,
+        # created once (hidden at zero width) and reshaped with coords()
+        x0 = self._bar_x0
+        self.fill_id = rounded_rect(self.canvas, x0, self._bar_y1, x0, self._bar_y2, r=self.track_r,
+                                    fill="#2ecc71", outline="", state="hidden")
+        self._fill_key = None  # (pixel x2, color) last drawn, None while hidden
+
+    def _build_color_table(self):
+        """
+        Precomputes the fill color for every value from 0 to progress_max.
+        """
+        self._color_table = [pick_color_from_thresholds(v, self.thresholds, default="#2ecc71")
+                             for v in range(self.progress_max + 1)]
 
     def _draw_track(self):
         """
@@ -178,25 +269,34 @@ class ProgressCard(Card):
         """
         Sets progress bar value and updates numeric display. Stops at max value.
         """
+        if new_value == self.current_value:
+            return
+        self.current_value = new_value
         # Update numeric value
         self.canvas.itemconfigure(self.num_text, text=str(new_value))
         # Calculate fill proportion (capped at 1.0)
         proportion = min(max(new_value / float(self.progress_max), 0.0), 1.0)
-        x1 = self.track_x1 + 2
-        x2 = self.track_x1 + 2 + (self.track_x2 - self.track_x1 - 4) * proportion
-        y1 = self.track_y - (self.track_r - 2)
-        y2 = self.track_y + (self.track_r - 2)
-        fill_color = pick_color_from_thresholds(new_value, self.thresholds, default="#2ecc71")
-        # Remove previous fill
-        if self.fill_id:
-            try:
-                self.canvas.delete(self.fill_id)
-            except Exception:
-                pass
-            self.fill_id = None
-        # Draw new fill if any
-        if x2 > x1 + 1:
-            self.fill_id = rounded_rect(self.canvas, x1, y1, x2, y2, r=self.track_r, fill=fill_color, outline="")
+        fill_width = self._bar_width * proportion
+        # Empty bar: hide the fill without computing a color
+        if fill_width <= self._min_visible_width:
+            if self._fill_key is not None:
+                self._fill_key = None
+                self.canvas.itemconfigure(self.fill_id, state="hidden")
+            return
+        x2 = self._bar_x0 + fill_width
+        if 0 <= new_value <= self.progress_max:
+            fill_color = self._color_table[int(new_value)]
+        else:
+            fill_color = pick_color_from_thresholds(new_value, self.thresholds, default="#2ecc71")
+        # Skip the fill update when the bar edge lands on the same pixel in the same color
+        fill_key = (int(x2), fill_color)
+        if fill_key == self._fill_key:
+            return
+        self._fill_key = fill_key
+        # Reshape the fill; its corners shrink to fit when it is narrower than the track radius
+        self.canvas.coords(self.fill_id, *rounded_rect_points(self._bar_x0, self._bar_y1, x2, self._bar_y2,
+                                                             r=self.track_r))
+        self.canvas.itemconfigure(self.fill_id, fill=fill_color, state="normal")
 
     # Allow ProgressCard to be packed/gridded
     def pack(self, **kwargs):
@@ -249,112 +349,204 @@ ws_card.pack(side="left", padx=20)
 instr = tk.Label(main, text="Press ESC to exit", font=(FONT_FAMILY, 14), bg=WINDOW_BG, fg="#333333")
 instr.pack(pady=(30, 40))
 
+# Fault banner, shown above the header only while the HAT is not answering
+fault_banner = tk.Label(main, text="Sensor board not responding - retrying", font=(FONT_FAMILY, 20, "bold"),
+                        bg="#e74c3c", fg="white")
+
 # -------------------------
-# Sensor reading & UI update loop
-# (EDGE DETECTION + COOLDOWN AFTER RELEASE)
+# UI update (only when values changed)
+# Only the Tk thread touches widgets: the UI build and first update_ui() at
+# startup before mainloop(), then refresh_ui, the fixed-rate (UI_REFRESH_MS)
+# frame tick. The sensor thread never calls Tk; it only writes sensor_state,
+# under sensor_state.lock.
 # -------------------------
-def read_inputs_and_update():
+def update_ui(ohb, ws):
     """
-    Poll sensors and update counts.
-
-    Logic summary:
-    - On rising edge (sensor goes LOW -> HIGH) we always set the "detected" flag
-      to True (marks the sensor as held). If the previous release timer has aged
-      past SENSOR_DELAY, we count immediately. If not, we do not count but still
-      mark the sensor as held so holding won't cause a later auto-count.
-    - On falling edge (sensor goes HIGH -> LOW), we set the timer to now. The
-      next rising edge will only be accepted for counting if now - timer >= SENSOR_DELAY.
+    Pushes the given sums to the cards that changed since the last call.
     """
-    global count_ohb, count_ws, sum_ohb, sum_ws
     global prev_total, prev_ohb, prev_ws
-    global sig_ohb_add_detected, sig_ohb_sub_detected, sig_ws_add_detected, sig_ws_sub_detected
-    global timer_ohb_add, timer_ohb_sub, timer_ws_add, timer_ws_sub
 
-    try:
-        s1 = rel.get_in(CHANNEL_OHB_ADD)
-        s2 = rel.get_in(CHANNEL_OHB_SUB)
-        s3 = rel.get_in(CHANNEL_WS_ADD)
-        s4 = rel.get_in(CHANNEL_WS_SUB)
-    except Exception:
-        # hardware read failed; retry after a short delay
-        main.after(max(200, POLL_INTERVAL_MS), read_inputs_and_update)
-        return
-
-    # Use millisecond timestamps to match SENSOR_DELAY unit
-    now_ms = int(time.time() * 1000)
-
-    # -------------------------
-    # Overhead Buffer add (channel 1)
-    # -------------------------
-    # Rising edge: sensor is HIGH now and was previously not detected (i.e. rising moment)
-    if s1 == 1 and not sig_ohb_add_detected:
-        # Mark the sensor as held immediately (prevents auto-count later while held)
-        sig_ohb_add_detected = True
-        # If cooldown since last release has passed, count immediately
-        if (now_ms - timer_ohb_add) >= SENSOR_DELAY:
-            # We count instantly on the rising edge
-            sum_ohb += 1
-
-    # Falling edge: sensor went LOW while previously detected HIGH -> set the cooldown timer
-    elif s1 != 1 and sig_ohb_add_detected:
-        timer_ohb_add = now_ms
-        sig_ohb_add_detected = False
-
-    # -------------------------
-    # Overhead Buffer subtract (channel 2)
-    # -------------------------
-    if s2 == 1 and not sig_ohb_sub_detected:
-        sig_ohb_sub_detected = True
-        if (now_ms - timer_ohb_sub) >= SENSOR_DELAY:
-            if sum_ohb > 0:
-                sum_ohb -= 1
-    elif s2 != 1 and sig_ohb_sub_detected:
-        timer_ohb_sub = now_ms
-        sig_ohb_sub_detected = False
-
-    # -------------------------
-    # Wet Section add (channel 3)
-    # -------------------------
-    if s3 == 1 and not sig_ws_add_detected:
-        sig_ws_add_detected = True
-        if (now_ms - timer_ws_add) >= SENSOR_DELAY:
-            sum_ws += 1
-    elif s3 != 1 and sig_ws_add_detected:
-        timer_ws_add = now_ms
-        sig_ws_add_detected = False
-
-    # -------------------------
-    # Wet Section subtract (channel 4)
-    # -------------------------
-    if s4 == 1 and not sig_ws_sub_detected:
-        sig_ws_sub_detected = True
-        if (now_ms - timer_ws_sub) >= SENSOR_DELAY:
-            if sum_ws > 0:
-                sum_ws -= 1
-    elif s4 != 1 and sig_ws_sub_detected:
-        timer_ws_sub = now_ms
-        sig_ws_sub_detected = False
-
-    # -------------------------
-    # Update UI (only when values changed)
-    # -------------------------
-    total = sum_ohb + sum_ws
+    total = ohb + ws
 
     if total != prev_total:
         total_card.set_value(total)
         prev_total = total
 
-    if sum_ohb != prev_ohb:
-        ohb_card.set_value(sum_ohb)
-        prev_ohb = sum_ohb
+    if ohb != prev_ohb:
+        ohb_card.set_value(ohb)
+        prev_ohb = ohb
+
+    if ws != prev_ws:
+        ws_card.set_value(ws)
+        prev_ws = ws
+
+def show_fault(fault):
+    """
+    Shows or hides the fault banner when the HAT fault state changes.
+    """
+    global prev_fault
 
-    if sum_ws != prev_ws:
-        ws_card.set_value(sum_ws)
-        prev_ws = sum_ws
+    if fault == prev_fault:
+        return
+    if fault:
+        fault_banner.pack(before=header, fill="x")
+    else:
+        fault_banner.pack_forget()
+    prev_fault = fault
 
-    # Schedule next poll
-    main.after(POLL_INTERVAL_MS, read_inputs_and_update)
+def refresh_ui():
+    """
+    Runs on the Tk thread: shows the sensor thread's latest sums, if they changed.
+    Bursts of sensor edges between two refreshes are coalesced into one redraw.
+    """
+    if sensor_state.dirty:
+        with sensor_state.lock:
+            ohb, ws, fault = sensor_state.sum_ohb, sensor_state.sum_ws, sensor_state.fault
+            sensor_state.dirty = False
+        update_ui(ohb, ws)
+        show_fault(fault)
+    tcl_call("after", UI_REFRESH_MS, refresh_ui_cmd)
+
+# refresh_ui re-arms itself every UI_REFRESH_MS. main.after() registers (and later
+# deletes) a fresh Tcl command on every call, so register it once and re-arm it
+# with a plain Tcl "after" instead.
+tcl_call = main.tk.call
+refresh_ui_cmd = main.register(refresh_ui)
 
-# Start the loop
-main.after(200, read_inputs_and_update)
+# -------------------------
+# Sensor reading (background thread)
+# (DEBOUNCE + EDGE DETECTION)
+# -------------------------
+def poll_sensors():
+    """
+    Poll sensors once and update counts. Returns False if the hardware read failed.
+
+    Logic summary:
+    - Debounce: each sensor has an integrator that counts up while the input is
+      HIGH and down while it is LOW, clamped to 0..DEBOUNCE_SAMPLES. Short
+      chatter moves it a step or two but does not carry it across a threshold.
+    - Rising edge: the integrator reaches DEBOUNCE_ON while the sensor's bit in
+      held_bits is clear. The bit is set and we count once.
+    - Falling edge: the integrator drops to DEBOUNCE_OFF while the bit is set.
+      The bit is cleared and the sensor is ready for the next tray.
+    - Changed sums are published to sensor_state for the UI thread; this never touches Tk.
+    """
+    global count_ohb, count_ws, sum_ohb, sum_ws
+    global prev_bits, settling_bits, held_bits
+
+    try:
+        bits = read_input_bits()
+    except Exception:
+        return False
+
+    # Inputs unchanged and every integrator saturated: nothing can cross a threshold
+    if bits == prev_bits and not settling_bits:
+        return True
+    prev_bits = bits
+
+    # Bind hot lookups to locals for the per-sensor loop
+    masks, integ = SENSOR_MASKS, sig_integ
+    n, on, off = DEBOUNCE_SAMPLES, DEBOUNCE_ON, DEBOUNCE_OFF
+
+    # Step every integrator and collect which sensors sit at the ON / OFF thresholds
+    settling = on_bits = off_bits = 0
+    for i in range(4):
+        mask = masks[i]
+        level = integ[i]
+        if bits & mask:
+            if level < n:
+                level += 1
+                settling |= mask
+        elif level > 0:
+            level -= 1
+            settling |= mask
+        integ[i] = level
+        if level >= on:
+            on_bits |= mask
+        elif level <= off:
+            off_bits |= mask
+    settling_bits = settling
+
+    # Latch all four sensors at once: rising = newly ON, falling sensors drop out of held_bits
+    rising = on_bits & ~held_bits
+    held_bits = (held_bits | rising) & ~off_bits
+    if not rising:
+        return True
+
+    # Count once per rising edge
+    sums = [sum_ohb, sum_ws]
+    while rising:
+        low = rising & -rising
+        rising ^= low
+        i = SENSOR_INDEX[low]
+        target = SENSOR_TARGETS[i]
+        # Subtract sensors never take a sum below zero
+        if SENSOR_SIGNS[i] > 0 or sums[target] > 0:
+            sums[target] += SENSOR_SIGNS[i]
+
+    if sums[0] != sum_ohb or sums[1] != sum_ws:
+        sum_ohb, sum_ws = sums
+        with sensor_state.lock:
+            sensor_state.sum_ohb, sensor_state.sum_ws = sums
+            sensor_state.dirty = True
+    return True
+
+def set_sensor_fault(fault):
+    """
+    Publishes the HAT fault state to the UI thread.
+    """
+    with sensor_state.lock:
+        if sensor_state.fault != fault:
+            sensor_state.fault = fault
+            sensor_state.dirty = True
+
+def sensor_loop():
+    """
+    Background thread body: polls the sensors on a fixed POLL_INTERVAL_MS tick until sensor_stop is set.
+
+    Failed reads back off exponentially up to READ_RETRY_MAX_MS. After
+    READ_FAILS_BEFORE_RESET failures in a row the fault is shown on screen and
+    the HAT is re-opened on every further retry until a read succeeds again.
+    """
+    # Bind everything the loop touches to locals once, for the life of the thread
+    poll = poll_sensors
+    now_ns = time.monotonic_ns
+    stopped, wait = sensor_stop.is_set, sensor_stop.wait
+    interval_ns = POLL_INTERVAL_MS * 1_000_000
+    retry_max_ns = READ_RETRY_MAX_MS * 1_000_000
+
+    fails = 0
+    retry_ns = interval_ns
+    next_tick = now_ns()
+    while not stopped():
+        if poll():
+            if fails:
+                # Recovered: back to the normal cadence
+                fails = 0
+                retry_ns = interval_ns
+                set_sensor_fault(False)
+            next_tick += interval_ns
+        else:
+            fails += 1
+            retry_ns = min(2 * retry_ns, retry_max_ns)
+            if fails >= READ_FAILS_BEFORE_RESET:
+                set_sensor_fault(True)
+                try:
+                    connect_hat()
+                except Exception:
+                    pass
+            next_tick = now_ns() + retry_ns
+        # Sleep to the next tick; if we overran it, resync instead of bursting to catch up
+        delay_ns = next_tick - now_ns()
+        if delay_ns <= 0:
+            next_tick = now_ns()
+            continue
+        wait(delay_ns / 1e9)
+
+# Show the starting values, then start the sensor thread and the UI refresh
+update_ui(sum_ohb, sum_ws)
+sensor_thread = threading.Thread(target=sensor_loop, name="sensor_loop", daemon=True)
+sensor_thread.start()
+tcl_call("after", UI_REFRESH_MS, refresh_ui_cmd)
 main.mainloop()
+sensor_stop.set()